@@ -2,32 +2,133 @@
 
 import asyncio
 import logging
+import sqlite3
 import time
+from collections import OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import aclosing
 from typing import Optional
 
 from aiohttp import web
 
-from voipms_client import VoipMsClient, VoipMsError
+from voipms_client import CHUNK_SIZE, VoipMsClient, VoipMsError
 
 _LOGGER = logging.getLogger(__name__)
 
 # Cache audio for 5 minutes to avoid repeated API calls
 CACHE_TTL = 300
 
+# Persistent cache on the addon data volume. Message numbers are positions
+# in a folder and change when messages are deleted or moved, so entries
+# expire after CACHE_TTL like the in-memory ones
+CACHE_DB_PATH = "/data/audio_cache.sqlite"
+DISK_CACHE_MAX_BYTES = 128 * 1024 * 1024
+
+# Default size budget for audio held in memory
+MEMORY_CACHE_MAX_BYTES = 128 * 1024 * 1024
+
+AUDIO_CONTENT_TYPE = "audio/wav"
+
+
+class _FetchInterrupted(Exception):
+    """Raised to waiters when the request fetching their audio goes away."""
+
+
+def _audio_response(mailbox: str, message_num: str) -> web.StreamResponse:
+    """Create a streaming response with audio headers set.
+
+    Args:
+        mailbox: Mailbox ID
+        message_num: Message number
+
+    Returns:
+        Unprepared streaming response
+    """
+    response = web.StreamResponse()
+    response.content_type = AUDIO_CONTENT_TYPE
+    response.headers["Accept-Ranges"] = "bytes"
+    response.headers["Content-Disposition"] = (
+        f'inline; filename="voicemail_{mailbox}_{message_num}.wav"'
+    )
+    return response
+
 
 class AudioCache:
-    """Simple in-memory cache for audio files."""
+    """Cache for audio files, in memory and optionally on disk."""
 
-    def __init__(self, ttl: int = CACHE_TTL):
+    def __init__(
+        self,
+        ttl: int = CACHE_TTL,
+        max_bytes: int = MEMORY_CACHE_MAX_BYTES,
+        db_path: Optional[str] = None,
+        max_disk_bytes: int = DISK_CACHE_MAX_BYTES
+    ):
         """Initialize cache.
 
         Args:
             ttl: Time-to-live in seconds for cached items
+            max_bytes: Size budget for items cached in memory
+            db_path: Optional SQLite database path for the persistent cache
+            max_disk_bytes: Size budget for the persistent cache
         """
-        self._cache: dict[str, tuple[bytes, float]] = {}
+        self._cache: OrderedDict[str, tuple[bytes, float]] = OrderedDict()
+        self._expiry: deque[tuple[float, str]] = deque()
         self._ttl = ttl
+        self._bytes = 0
+        self._max_bytes = max_bytes
+        self._max_disk_bytes = max_disk_bytes
+        self._db: Optional[sqlite3.Connection] = None
+        # SQLite work runs on its own single thread, which serializes
+        # access and keeps it off the default executor
+        self._executor: Optional[ThreadPoolExecutor] = None
+
+        if db_path:
+            try:
+                self._db = self._open_db(db_path, ttl)
+                self._executor = ThreadPoolExecutor(
+                    max_workers=1,
+                    thread_name_prefix="voipms-cache"
+                )
+            except sqlite3.Error as err:
+                _LOGGER.warning(
+                    "Persistent audio cache unavailable at %s: %s",
+                    db_path, err
+                )
 
-    def get(self, key: str) -> Optional[bytes]:
+    @staticmethod
+    def _open_db(db_path: str, ttl: int) -> sqlite3.Connection:
+        """Open the persistent cache database.
+
+        Entries that expired while the addon was stopped are deleted.
+
+        Args:
+            db_path: SQLite database path
+            ttl: Time-to-live in seconds for cached items
+
+        Returns:
+            Database connection
+        """
+        db = sqlite3.connect(
+            db_path,
+            isolation_level=None,
+            check_same_thread=False
+        )
+        db.execute("PRAGMA journal_mode=WAL")
+        db.execute("PRAGMA synchronous=NORMAL")
+        db.execute(
+            "CREATE TABLE IF NOT EXISTS audio ("
+            "key TEXT PRIMARY KEY, data BLOB NOT NULL, "
+            "ts REAL NOT NULL, last_access REAL NOT NULL)"
+        )
+        db.execute(
+            "CREATE INDEX IF NOT EXISTS audio_last_access "
+            "ON audio (last_access)"
+        )
+        db.execute("CREATE INDEX IF NOT EXISTS audio_ts ON audio (ts)")
+        db.execute("DELETE FROM audio WHERE ts <= ?", (time.time() - ttl,))
+        return db
+
+    async def get(self, key: str) -> Optional[bytes]:
         """Get cached audio data.
 
         Args:
@@ -36,32 +137,160 @@ class AudioCache:
         Returns:
             Audio bytes if cached and not expired, None otherwise
         """
-        if key in self._cache:
-            data, timestamp = self._cache[key]
-            if time.time() - timestamp < self._ttl:
-                return data
+        now = time.monotonic()
+        self._cleanup(now)
+        entry = self._cache.get(key)
+        if entry is not None:
+            if entry[1] > now:
+                self._cache.move_to_end(key)
+                return entry[0]
+            # Entries restored from disk can expire ahead of the deque order
             del self._cache[key]
-        return None
+            self._bytes -= len(entry[0])
+
+        if self._db is None:
+            return None
 
-    def set(self, key: str, data: bytes):
+        try:
+            row = await asyncio.get_running_loop().run_in_executor(
+                self._executor, self._db_get, key
+            )
+        except sqlite3.Error as err:
+            _LOGGER.warning("Failed to read persistent audio cache: %s", err)
+            return None
+
+        if row is None:
+            return None
+
+        # Keep the entry's original expiry when copying it into memory
+        data, age = row
+        self._set_memory(key, data, now - age)
+        return data
+
+    async def set(self, key: str, data: bytes):
         """Cache audio data.
 
         Args:
             key: Cache key
             data: Audio bytes to cache
         """
-        self._cache[key] = (data, time.time())
-        self._cleanup()
+        now = time.monotonic()
+        self._cleanup(now)
+        self._set_memory(key, data, now)
+
+        if self._db is None:
+            return
+
+        try:
+            await asyncio.get_running_loop().run_in_executor(
+                self._executor, self._db_set, key, data
+            )
+        except sqlite3.Error as err:
+            _LOGGER.warning("Failed to write persistent audio cache: %s", err)
+
+    def close(self):
+        """Close the persistent cache database."""
+        if self._db is not None:
+            self._executor.shutdown(wait=True)
+            self._db.close()
+            self._db = None
+            self._executor = None
+
+    def _set_memory(self, key: str, data: bytes, now: float):
+        """Cache audio data in memory.
+
+        Least recently used entries are evicted once the cache exceeds
+        its size budget.
+
+        Args:
+            key: Cache key
+            data: Audio bytes to cache
+            now: Monotonic time the audio was fetched
+        """
+        old = self._cache.pop(key, None)
+        if old is not None:
+            self._bytes -= len(old[0])
+
+        expires = now + self._ttl
+        self._cache[key] = (data, expires)
+        self._bytes += len(data)
+        self._expiry.append((expires, key))
 
-    def _cleanup(self):
-        """Remove expired entries."""
+        while self._bytes > self._max_bytes:
+            _, (evicted, _) = self._cache.popitem(last=False)
+            self._bytes -= len(evicted)
+
+    def _cleanup(self, now: float):
+        """Remove expired entries.
+
+        Args:
+            now: Current monotonic time
+        """
+        while self._expiry and self._expiry[0][0] <= now:
+            expires, key = self._expiry.popleft()
+            entry = self._cache.get(key)
+            # Skip stale expiry records for keys that were set again since
+            if entry is not None and entry[1] == expires:
+                del self._cache[key]
+                self._bytes -= len(entry[0])
+
+    def _db_get(self, key: str) -> Optional[tuple[bytes, float]]:
+        """Read an entry from the persistent cache (blocking).
+
+        Returns:
+            Tuple of (audio bytes, age in seconds) if cached and not
+            expired, None otherwise
+        """
         now = time.time()
-        expired = [
-            k for k, (_, ts) in self._cache.items()
-            if now - ts >= self._ttl
-        ]
-        for key in expired:
-            del self._cache[key]
+        row = self._db.execute(
+            "SELECT data, ts FROM audio WHERE key = ?", (key,)
+        ).fetchone()
+        if row is None:
+            return None
+
+        data, ts = row
+        if now - ts >= self._ttl:
+            self._db.execute("DELETE FROM audio WHERE key = ?", (key,))
+            return None
+
+        self._db.execute(
+            "UPDATE audio SET last_access = ? WHERE key = ?",
+            (now, key)
+        )
+        return data, now - ts
+
+    def _db_set(self, key: str, data: bytes):
+        """Write an entry to the persistent cache (blocking).
+
+        Expired entries are deleted, then least recently used entries
+        until the cache is within its size budget.
+        """
+        # Wall-clock time: rows outlive the process, monotonic time doesn't
+        now = time.time()
+        self._db.execute(
+            "DELETE FROM audio WHERE ts <= ?", (now - self._ttl,)
+        )
+        self._db.execute(
+            "INSERT OR REPLACE INTO audio (key, data, ts, last_access) "
+            "VALUES (?, ?, ?, ?)",
+            (key, data, now, now)
+        )
+        (total,) = self._db.execute(
+            "SELECT COALESCE(SUM(LENGTH(data)), 0) FROM audio"
+        ).fetchone()
+        if total <= self._max_disk_bytes:
+            return
+
+        evict = []
+        for old_key, size in self._db.execute(
+            "SELECT key, LENGTH(data) FROM audio ORDER BY last_access"
+        ):
+            if total <= self._max_disk_bytes:
+                break
+            evict.append((old_key,))
+            total -= size
+        self._db.executemany("DELETE FROM audio WHERE key = ?", evict)
+        _LOGGER.debug("Evicted %d entries from audio cache", len(evict))
 
 
 class AudioServer:
@@ -71,7 +300,9 @@ class AudioServer:
         self,
         voipms_client: VoipMsClient,
         port: int = 8099,
-        host: str = "0.0.0.0"
+        host: str = "0.0.0.0",
+        cache_path: Optional[str] = CACHE_DB_PATH,
+        cache_max_bytes: int = MEMORY_CACHE_MAX_BYTES
     ):
         """Initialize audio server.
 
@@ -79,11 +310,18 @@ class AudioServer:
             voipms_client: VoIP.ms API client
             port: Port to listen on
             host: Host to bind to
+            cache_path: SQLite path for the persistent audio cache, or
+                None to cache in memory only
+            cache_max_bytes: Size budget for audio cached in memory
         """
         self._client = voipms_client
         self._port = port
         self._host = host
-        self._cache = AudioCache()
+        self._cache = AudioCache(
+            max_bytes=cache_max_bytes,
+            db_path=cache_path
+        )
+        self._inflight: dict[str, asyncio.Future[bytes]] = {}
         self._app = web.Application()
         self._runner: Optional[web.AppRunner] = None
         self._setup_routes()
@@ -103,7 +341,7 @@ class AudioServer:
     async def _handle_audio_request(
         self,
         request: web.Request
-    ) -> web.Response:
+    ) -> web.StreamResponse:
         """Handle audio streaming requests.
 
         Args:
@@ -120,56 +358,173 @@ class AudioServer:
         _LOGGER.debug("Audio request: %s", cache_key)
 
         # Check cache first
-        audio_data = self._cache.get(cache_key)
+        audio_data = await self._cache.get(cache_key)
         if audio_data:
             _LOGGER.debug("Serving cached audio: %s", cache_key)
-            return web.Response(
-                body=audio_data,
-                content_type="audio/wav",
-                headers={
-                    "Content-Disposition": (
-                        f'inline; filename="voicemail_{mailbox}_{message_num}.wav"'
-                    )
-                }
-            )
-
-        # Fetch from API
-        try:
-            loop = asyncio.get_event_loop()
-            audio_data = await loop.run_in_executor(
-                None,
-                self._client.get_voicemail_message_file,
-                mailbox,
-                folder,
-                message_num
+            return await self._send_audio(
+                request, audio_data, mailbox, message_num
             )
 
+        # Another request may already be fetching this file; reuse its
+        # result, or take over the fetch if that request goes away first
+        while True:
+            inflight = self._inflight.get(cache_key)
+            if inflight is None:
+                break
+            _LOGGER.debug("Waiting for in-flight audio fetch: %s", cache_key)
+            try:
+                # Shield so a disconnecting waiter can't cancel the fetch
+                audio_data = await asyncio.shield(inflight)
+            except _FetchInterrupted:
+                continue
+            except VoipMsError as err:
+                return web.Response(
+                    status=500,
+                    text=f"Failed to fetch audio: {err}"
+                )
             if not audio_data:
                 return web.Response(
                     status=404,
                     text="Audio file not found"
                 )
+            return await self._send_audio(
+                request, audio_data, mailbox, message_num
+            )
 
-            # Cache the audio
-            self._cache.set(cache_key, audio_data)
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[cache_key] = future
+        try:
+            return await self._stream_audio(
+                request, cache_key, future, mailbox, folder, message_num
+            )
+        finally:
+            del self._inflight[cache_key]
+            if not future.done():
+                future.set_exception(_FetchInterrupted())
+            # Errors are reported by this request; don't warn when no
+            # other request was waiting for the result
+            future.exception()
+
+    async def _stream_audio(
+        self,
+        request: web.Request,
+        cache_key: str,
+        future: asyncio.Future,
+        mailbox: str,
+        folder: str,
+        message_num: str
+    ) -> web.StreamResponse:
+        """Stream audio from the API and publish the result to waiters.
 
-            return web.Response(
-                body=audio_data,
-                content_type="audio/wav",
-                headers={
-                    "Content-Disposition": (
-                        f'inline; filename="voicemail_{mailbox}_{message_num}.wav"'
-                    )
-                }
+        Args:
+            request: HTTP request
+            cache_key: Cache key for the audio file
+            future: Future resolved with the complete audio bytes
+            mailbox: Mailbox ID
+            folder: Folder name
+            message_num: Message number
+
+        Returns:
+            Audio response or error
+        """
+        response = None
+        chunks = []
+        try:
+            async with aclosing(self._client.stream_voicemail_message_file(
+                mailbox,
+                folder,
+                message_num
+            )) as stream:
+                async for chunk in stream:
+                    if response is None:
+                        response = _audio_response(mailbox, message_num)
+                        await response.prepare(request)
+                    chunks.append(chunk)
+                    await response.write(chunk)
+
+        except ConnectionResetError:
+            # Client went away; waiters (if any) take over the fetch
+            _LOGGER.debug(
+                "Client disconnected during audio stream: %s", cache_key
             )
+            return response
 
         except VoipMsError as err:
             _LOGGER.error("Failed to fetch audio: %s", err)
+            future.set_exception(err)
+            if response is not None:
+                # Headers already sent; abort the connection
+                raise
             return web.Response(
                 status=500,
                 text=f"Failed to fetch audio: {err}"
             )
 
+        audio_data = b"".join(chunks)
+        future.set_result(audio_data)
+
+        if response is None:
+            return web.Response(
+                status=404,
+                text="Audio file not found"
+            )
+
+        # Cache the audio
+        await self._cache.set(cache_key, audio_data)
+
+        await response.write_eof()
+        return response
+
+    async def _send_audio(
+        self,
+        request: web.Request,
+        audio_data: bytes,
+        mailbox: str,
+        message_num: str
+    ) -> web.StreamResponse:
+        """Send already-downloaded audio in chunks.
+
+        Honors a single byte range in the Range header so players can
+        seek without downloading the whole file again.
+
+        Args:
+            request: HTTP request
+            audio_data: Complete audio file bytes
+            mailbox: Mailbox ID
+            message_num: Message number
+
+        Returns:
+            Audio response, partial content, or range error
+        """
+        size = len(audio_data)
+        try:
+            byte_range = request.http_range
+        except ValueError:
+            # Malformed or unsupported ranges are ignored
+            byte_range = slice(None, None)
+
+        response = _audio_response(mailbox, message_num)
+        start, end = 0, size
+        if byte_range.start is not None or byte_range.stop is not None:
+            start, end, _ = byte_range.indices(size)
+            if start >= end:
+                return web.Response(
+                    status=416,
+                    headers={"Content-Range": f"bytes */{size}"}
+                )
+            response.set_status(206)
+            response.headers["Content-Range"] = (
+                f"bytes {start}-{end - 1}/{size}"
+            )
+
+        response.content_length = end - start
+        await response.prepare(request)
+        view = memoryview(audio_data)[start:end]
+        for offset in range(0, len(view), CHUNK_SIZE):
+            await response.write(view[offset:offset + CHUNK_SIZE])
+        await response.write_eof()
+        return response
+
     async def start(self):
         """Start the HTTP server."""
         self._runner = web.AppRunner(self._app)
@@ -183,6 +538,7 @@ class AudioServer:
         if self._runner:
             await self._runner.cleanup()
             _LOGGER.info("Audio server stopped")
+        self._cache.close()
 
     @property
     def base_url(self) -> str:
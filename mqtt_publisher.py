@@ -1,11 +1,26 @@
 """MQTT publisher for Home Assistant discovery and state updates."""
 
+import hashlib
 import json
 import logging
+import socket
 from typing import Callable, Optional
 
 import paho.mqtt.client as mqtt
 
+try:
+    import orjson
+
+    def _json_dumps(obj) -> bytes:
+        """Serialize to compact JSON with sorted keys."""
+        return orjson.dumps(obj, option=orjson.OPT_SORT_KEYS)
+
+except ImportError:
+    # orjson has no wheels for some addon architectures
+    def _json_dumps(obj) -> bytes:
+        """Serialize to compact JSON with sorted keys."""
+        return json.dumps(obj, separators=(",", ":"), sort_keys=True).encode()
+
 _LOGGER = logging.getLogger(__name__)
 
 DISCOVERY_PREFIX = "homeassistant"
@@ -34,17 +49,32 @@ class MqttPublisher:
         """
         self.host = host
         self.port = port
-        self._client = mqtt.Client(client_id="voipms_voicemail")
+        self._client = mqtt.Client(
+            client_id="voipms_voicemail",
+            protocol=mqtt.MQTTv5
+        )
         self._connected = False
         self._on_connect_callback = on_connect_callback
+        self._last_hash: dict[str, bytes] = {}
+        self._pending: dict[str, tuple[str, bytes, bytes]] = {}
+        self._last_discovery_hash: dict[str, bytes] = {}
 
         if username:
             self._client.username_pw_set(username, password)
 
+        self._client.max_inflight_messages_set(100)
         self._client.on_connect = self._on_connect
         self._client.on_disconnect = self._on_disconnect
+        self._client.on_socket_open = self._on_socket_open
 
-    def _on_connect(self, client, userdata, flags, rc):
+    def _on_socket_open(self, client, userdata, sock):
+        """Disable Nagle's algorithm so small publishes aren't delayed."""
+        try:
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        except (AttributeError, OSError) as err:
+            _LOGGER.debug("Could not set TCP_NODELAY: %s", err)
+
+    def _on_connect(self, client, userdata, flags, rc, properties=None):
         """Handle connection to MQTT broker."""
         if rc == 0:
             _LOGGER.info("Connected to MQTT broker")
@@ -55,7 +85,7 @@ class MqttPublisher:
             _LOGGER.error("Failed to connect to MQTT broker: %s", rc)
             self._connected = False
 
-    def _on_disconnect(self, client, userdata, rc):
+    def _on_disconnect(self, client, userdata, rc, properties=None):
         """Handle disconnection from MQTT broker."""
         _LOGGER.warning("Disconnected from MQTT broker: %s", rc)
         self._connected = False
@@ -116,63 +146,113 @@ class MqttPublisher:
 
         discovery_topic = f"{DISCOVERY_PREFIX}/sensor/voipms_{mailbox}/config"
 
-        self._client.publish(
+        # The broker retains discovery configs, so only publish on change
+        payload = _json_dumps(config)
+        payload_hash = hashlib.blake2b(payload, digest_size=16).digest()
+        if self._last_discovery_hash.get(mailbox) == payload_hash:
+            return
+
+        info = self._client.publish(
             discovery_topic,
-            json.dumps(config),
+            payload,
             retain=True,
             qos=1
         )
+        if info.rc == mqtt.MQTT_ERR_SUCCESS:
+            self._last_discovery_hash[mailbox] = payload_hash
         _LOGGER.debug("Published discovery config for mailbox %s", mailbox)
 
     def publish_state(
         self,
         mailbox: str,
-        new_count: int,
-        total_count: int,
         messages: list[dict],
         audio_base_url: str
-    ):
-        """Publish voicemail state for a mailbox.
+    ) -> tuple[int, int]:
+        """Queue voicemail state for a mailbox.
+
+        Changed state is sent on the next call to flush().
 
         Args:
             mailbox: Mailbox ID
-            new_count: Number of new (unlistened) messages
-            total_count: Total number of messages
-            messages: List of message metadata
+            messages: List of message metadata, enriched in place with
+                audio URLs
             audio_base_url: Base URL for audio streaming
-        """
-        state_topic = f"{STATE_PREFIX}/{mailbox}/state"
-        attr_topic = f"{STATE_PREFIX}/{mailbox}/attributes"
 
-        # Enrich messages with audio URLs
-        enriched_messages = []
+        Returns:
+            Tuple of (new message count, total message count)
+        """
+        # Enrich messages with audio URLs (in place; the caller owns them)
+        # and count new (not listened) messages in the same pass
+        audio_prefix = f"{audio_base_url}/audio/{mailbox}/"
+        new_count = 0
         for msg in messages:
-            enriched = dict(msg)
-            folder = msg.get("folder", "INBOX")
+            if msg.get("listened") == "no":
+                new_count += 1
             msg_num = msg.get("message_num", "")
             if msg_num:
-                enriched["audio_url"] = (
-                    f"{audio_base_url}/audio/{mailbox}/{folder}/{msg_num}"
+                msg["audio_url"] = (
+                    f"{audio_prefix}{msg.get('folder', 'INBOX')}/{msg_num}"
                 )
-            enriched_messages.append(enriched)
+        total_count = len(messages)
 
         attributes = {
             "total_messages": total_count,
             "new_messages": new_count,
-            "messages": enriched_messages,
+            "messages": messages,
         }
 
-        self._client.publish(state_topic, str(new_count), retain=True, qos=1)
-        self._client.publish(
-            attr_topic,
-            json.dumps(attributes),
-            retain=True,
-            qos=1
-        )
+        # Skip publishing if nothing changed since the last update
+        payload = _json_dumps(attributes)
+        payload_hash = hashlib.blake2b(payload, digest_size=16).digest()
+        if self._last_hash.get(mailbox) == payload_hash:
+            _LOGGER.debug("State unchanged for mailbox %s", mailbox)
+            return new_count, total_count
+
+        self._pending[mailbox] = (str(new_count), payload, payload_hash)
         _LOGGER.debug(
-            "Published state for mailbox %s: %d new, %d total",
+            "Queued state for mailbox %s: %d new, %d total",
             mailbox, new_count, total_count
         )
+        return new_count, total_count
+
+    def reset_state_hashes(self):
+        """Forget which state has been published.
+
+        QoS 0 publishes still queued when the connection drops are lost,
+        so after a reconnect the next flush() republishes every mailbox.
+        """
+        self._last_hash.clear()
+
+    def flush(self):
+        """Publish all queued state updates.
+
+        State topics are retained and republished on change, so they are
+        sent at QoS 0 without waiting for broker acknowledgements.
+        """
+        pending = self._pending
+        self._pending = {}
+
+        for mailbox, (state, attributes, payload_hash) in pending.items():
+            state_info = self._client.publish(
+                f"{STATE_PREFIX}/{mailbox}/state",
+                state,
+                retain=True,
+                qos=0
+            )
+            attr_info = self._client.publish(
+                f"{STATE_PREFIX}/{mailbox}/attributes",
+                attributes,
+                retain=True,
+                qos=0
+            )
+            if (state_info.rc == mqtt.MQTT_ERR_SUCCESS
+                    and attr_info.rc == mqtt.MQTT_ERR_SUCCESS):
+                self._last_hash[mailbox] = payload_hash
+            else:
+                self._last_hash.pop(mailbox, None)
+
+        if pending:
+            _LOGGER.debug("Published state for %d mailbox(es)", len(pending))
 
     def remove_discovery(self, mailbox: str):
         """Remove discovery config for a mailbox.
@@ -182,4 +262,5 @@ class MqttPublisher:
         """
         discovery_topic = f"{DISCOVERY_PREFIX}/sensor/voipms_{mailbox}/config"
         self._client.publish(discovery_topic, "", retain=True, qos=1)
+        self._last_discovery_hash.pop(mailbox, None)
         _LOGGER.debug("Removed discovery config for mailbox %s", mailbox)
@@ -8,6 +8,13 @@ import os
 import signal
 import sys
 import time
+from typing import Optional
+
+try:
+    import uvloop
+except ImportError:
+    # uvloop has no wheels for some addon architectures
+    uvloop = None
 
 from voipms_client import VoipMsClient, VoipMsError
 from mqtt_publisher import MqttPublisher
@@ -21,6 +28,9 @@ logging.basicConfig(
 )
 _LOGGER = logging.getLogger("voipms_voicemail")
 
+# Maximum number of mailboxes polled concurrently
+MAX_CONCURRENT_POLLS = 8
+
 
 def load_config() -> dict:
     """Load configuration from Home Assistant addon options.
@@ -45,6 +55,7 @@ def load_config() -> dict:
             "mqtt_username": os.environ.get("MQTT_USERNAME", ""),
             "mqtt_password": os.environ.get("MQTT_PASSWORD", ""),
             "audio_port": int(os.environ.get("AUDIO_PORT", "8099")),
+            "audio_cache_mb": int(os.environ.get("AUDIO_CACHE_MB", "128")),
         }
 
     with open(config_path) as f:
@@ -62,7 +73,9 @@ class VoicemailMonitor:
         """
         self.config = config
         self._running = False
-        self._discovered_mailboxes: set[str] = set()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        # Mailbox ID -> friendly name for mailboxes with published discovery
+        self._discovered_mailboxes: dict[str, Optional[str]] = {}
 
         # Initialize VoIP.ms client
         self.voipms = VoipMsClient(
@@ -83,6 +96,7 @@ class VoicemailMonitor:
         self.audio_server = AudioServer(
             voipms_client=self.voipms,
             port=config.get("audio_port", 8099),
+            cache_max_bytes=config.get("audio_cache_mb", 128) * 1024 * 1024,
         )
 
         # Get supervisor hostname for audio URL
@@ -90,9 +104,24 @@ class VoicemailMonitor:
         self._audio_port = config.get("audio_port", 8099)
 
     def _on_mqtt_connect(self):
-        """Handle MQTT connection - republish discovery."""
-        for mailbox in self._discovered_mailboxes:
-            self.mqtt.publish_discovery(mailbox)
+        """Handle MQTT connection - republish discovery.
+
+        Called from the paho network thread, so the work is handed to the
+        event loop that owns the monitor state.
+        """
+        if self._loop is not None:
+            self._loop.call_soon_threadsafe(self._republish_discovery)
+
+    def _republish_discovery(self):
+        """Republish discovery config not yet accepted by the broker.
+
+        Configs the broker has already retained are skipped by the
+        publisher. State is republished in full on the next poll, since
+        QoS 0 updates queued before a disconnect may have been dropped.
+        """
+        self.mqtt.reset_state_hashes()
+        for mailbox, mailbox_name in self._discovered_mailboxes.items():
+            self.mqtt.publish_discovery(mailbox, mailbox_name)
 
     def _get_audio_base_url(self) -> str:
         """Get the base URL for audio streaming.
@@ -122,57 +151,76 @@ class VoicemailMonitor:
             else:
                 # Discover all mailboxes
                 _LOGGER.debug("Discovering mailboxes...")
-                mailboxes = await asyncio.get_event_loop().run_in_executor(
-                    None, self.voipms.get_voicemails
-                )
-
-            audio_base_url = self._get_audio_base_url()
+                mailboxes = await self.voipms.get_voicemails()
+        except VoipMsError as err:
+            _LOGGER.error("Failed to poll voicemails: %s", err)
+            return
 
-            for mailbox_info in mailboxes:
-                mailbox = mailbox_info.get("mailbox")
-                if not mailbox:
-                    continue
+        audio_base_url = self._get_audio_base_url()
+        semaphore = asyncio.Semaphore(MAX_CONCURRENT_POLLS)
 
-                mailbox_name = mailbox_info.get("name")
+        async def _poll_one(mailbox_info: dict):
+            async with semaphore:
+                await self._poll_mailbox(mailbox_info, audio_base_url)
 
-                # Publish discovery if new mailbox
-                if mailbox not in self._discovered_mailboxes:
-                    self._discovered_mailboxes.add(mailbox)
-                    self.mqtt.publish_discovery(mailbox, mailbox_name)
+        results = await asyncio.gather(
+            *(_poll_one(mailbox_info) for mailbox_info in mailboxes),
+            return_exceptions=True,
+        )
 
-                # Get messages
-                messages = await asyncio.get_event_loop().run_in_executor(
-                    None, self.voipms.get_voicemail_messages, mailbox
-                )
+        self.mqtt.flush()
 
-                # Count new messages (not listened)
-                new_count = sum(
-                    1 for m in messages
-                    if m.get("listened") == "no"
+        for mailbox_info, result in zip(mailboxes, results):
+            if isinstance(result, VoipMsError):
+                _LOGGER.error(
+                    "Failed to poll mailbox %s: %s",
+                    mailbox_info.get("mailbox"), result
                 )
-                total_count = len(messages)
-
-                # Publish state
-                self.mqtt.publish_state(
-                    mailbox=mailbox,
-                    new_count=new_count,
-                    total_count=total_count,
-                    messages=messages,
-                    audio_base_url=audio_base_url,
+            elif isinstance(result, BaseException):
+                _LOGGER.error(
+                    "Unexpected error polling mailbox %s",
+                    mailbox_info.get("mailbox"),
+                    exc_info=result,
                 )
 
-        except VoipMsError as err:
-            _LOGGER.error("Failed to poll voicemails: %s", err)
+    async def _poll_mailbox(self, mailbox_info: dict, audio_base_url: str):
+        """Poll a single mailbox and publish its state.
+
+        Args:
+            mailbox_info: Mailbox dictionary with 'mailbox' and optional
+                'name' keys
+            audio_base_url: Base URL for audio streaming
+        """
+        mailbox = mailbox_info.get("mailbox")
+        if not mailbox:
+            return
+
+        mailbox_name = mailbox_info.get("name")
+
+        # Publish discovery if new mailbox
+        if mailbox not in self._discovered_mailboxes:
+            self._discovered_mailboxes[mailbox] = mailbox_name
+            self.mqtt.publish_discovery(mailbox, mailbox_name)
+
+        # Get messages
+        messages = await self.voipms.get_voicemail_messages(mailbox)
+
+        # Publish state
+        self.mqtt.publish_state(
+            mailbox=mailbox,
+            messages=messages,
+            audio_base_url=audio_base_url,
+        )
 
     async def run(self):
         """Run the main application loop."""
         _LOGGER.info("Starting VoIP.ms Voicemail Monitor")
+        self._loop = asyncio.get_running_loop()
 
         # Test VoIP.ms connection
+        await self.voipms.connect()
         try:
-            await asyncio.get_event_loop().run_in_executor(
-                None, self.voipms.test_connection
-            )
+            await self.voipms.test_connection()
             _LOGGER.info("VoIP.ms API connection successful")
         except VoipMsError as err:
             _LOGGER.error("Failed to connect to VoIP.ms API: %s", err)
@@ -210,6 +258,7 @@ class VoicemailMonitor:
 
         # Cleanup
         await self.audio_server.stop()
+        await self.voipms.close()
         self.mqtt.disconnect()
         _LOGGER.info("VoIP.ms Voicemail Monitor stopped")
 
@@ -219,6 +268,26 @@ class VoicemailMonitor:
         self._running = False
 
 
+async def _amain(config: dict):
+    """Run the monitor until it is stopped by a signal.
+
+    Args:
+        config: Configuration dictionary
+    """
+    monitor = VoicemailMonitor(config)
+
+    # Set up signal handlers
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        loop.add_signal_handler(sig, monitor.stop)
+
+    try:
+        await monitor.run()
+    finally:
+        # Also reached when startup fails and exits early
+        await monitor.voipms.close()
+
+
 def main():
     """Main entry point."""
     config = load_config()
@@ -231,24 +300,13 @@ def main():
         _LOGGER.error("voipms_api_password is required")
         sys.exit(1)
 
-    monitor = VoicemailMonitor(config)
-
-    # Set up signal handlers
-    loop = asyncio.new_event_loop()
-    asyncio.set_event_loop(loop)
-
-    def signal_handler():
-        monitor.stop()
-
-    for sig in (signal.SIGINT, signal.SIGTERM):
-        loop.add_signal_handler(sig, signal_handler)
+    if uvloop is not None:
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
 
     try:
-        loop.run_until_complete(monitor.run())
+        asyncio.run(_amain(config))
     except KeyboardInterrupt:
         _LOGGER.info("Interrupted")
-    finally:
-        loop.close()
 
 
 if __name__ == "__main__":
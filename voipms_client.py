@@ -1,14 +1,19 @@
 """VoIP.ms API client for voicemail operations."""
 
 import logging
-import requests
-from typing import Optional
+from typing import AsyncIterator, Optional
 from urllib.parse import urlencode
 
+import aiohttp
+from yarl import URL
+
 _LOGGER = logging.getLogger(__name__)
 
 API_URL = "https://voip.ms/api/v1/rest.php"
 
+# Read size when streaming audio files
+CHUNK_SIZE = 64 * 1024
+
 
 class VoipMsError(Exception):
     """Exception for VoIP.ms API errors."""
@@ -27,9 +32,48 @@ class VoipMsClient:
         """
         self.username = username
         self.api_password = api_password
-        self._session = requests.Session()
+        # Credentials never change, so encode them once
+        self._qs_prefix = urlencode({
+            "api_username": username,
+            "api_password": api_password,
+        })
+        self._session: Optional[aiohttp.ClientSession] = None
+
+    async def connect(self):
+        """Create the HTTP session used for API requests.
+
+        Must be called from within the running event loop before any
+        other method.
+        """
+        if self._session is None or self._session.closed:
+            # Cache DNS lookups for the API host for five minutes
+            connector = aiohttp.TCPConnector(ttl_dns_cache=300)
+            self._session = aiohttp.ClientSession(
+                connector=connector,
+                timeout=aiohttp.ClientTimeout(total=30)
+            )
+
+    async def close(self):
+        """Close the HTTP session."""
+        if self._session and not self._session.closed:
+            await self._session.close()
+        self._session = None
+
+    def _build_url(self, **params) -> URL:
+        """Build an API request URL.
+
+        Args:
+            **params: Query parameters in addition to the credentials
 
-    def _make_request(self, method: str, **params) -> dict:
+        Returns:
+            Pre-encoded request URL
+        """
+        return URL(
+            f"{API_URL}?{self._qs_prefix}&{urlencode(params)}",
+            encoded=True
+        )
+
+    async def _make_request(self, method: str, **params) -> dict:
         """Make an API request.
 
         Args:
@@ -42,17 +86,16 @@ class VoipMsClient:
         Raises:
             VoipMsError: If API returns an error
         """
-        params.update({
-            "api_username": self.username,
-            "api_password": self.api_password,
-            "method": method,
-        })
+        url = self._build_url(method=method, **params)
 
         try:
-            response = self._session.get(API_URL, params=params, timeout=30)
-            response.raise_for_status()
-            data = response.json()
-        except requests.RequestException as err:
+            async with self._session.get(url) as response:
+                response.raise_for_status()
+                # VoIP.ms does not always send application/json
+                data = await response.json(content_type=None)
+        except TimeoutError as err:
+            raise VoipMsError("API request failed: timed out") from err
+        except aiohttp.ClientError as err:
             raise VoipMsError(f"API request failed: {err}") from err
         except ValueError as err:
             raise VoipMsError(f"Invalid JSON response: {err}") from err
@@ -63,14 +106,14 @@ class VoipMsClient:
 
         return data
 
-    def get_voicemails(self) -> list[dict]:
+    async def get_voicemails(self) -> list[dict]:
         """Get list of all voicemail mailboxes.
 
         Returns:
             List of mailbox dictionaries with 'mailbox' and 'name' keys
         """
         try:
-            data = self._make_request("getVoicemails")
+            data = await self._make_request("getVoicemails")
             voicemails = data.get("voicemails", [])
             if isinstance(voicemails, dict):
                 voicemails = [voicemails]
@@ -80,7 +123,7 @@ class VoipMsClient:
                 return []
             raise
 
-    def get_voicemail_messages(
+    async def get_voicemail_messages(
         self,
         mailbox: str,
         folder: Optional[str] = None
@@ -99,7 +142,7 @@ class VoipMsClient:
             params["folder"] = folder
 
         try:
-            data = self._make_request("getVoicemailMessages", **params)
+            data = await self._make_request("getVoicemailMessages", **params)
             messages = data.get("messages", [])
             if isinstance(messages, dict):
                 messages = [messages]
@@ -109,50 +152,68 @@ class VoipMsClient:
                 return []
             raise
 
-    def get_voicemail_message_file(
+    async def stream_voicemail_message_file(
         self,
         mailbox: str,
         folder: str,
         message_num: str
-    ) -> bytes:
-        """Get voicemail audio file.
+    ) -> AsyncIterator[bytes]:
+        """Stream voicemail audio file in chunks.
 
         Args:
             mailbox: Mailbox ID
             folder: Folder name (INBOX, Old, etc.)
             message_num: Message number
 
-        Returns:
-            Audio file bytes (WAV format)
+        Yields:
+            Audio file chunks (WAV format) as they arrive
+
+        Raises:
+            VoipMsError: If the API returns an error
         """
-        params = {
-            "api_username": self.username,
-            "api_password": self.api_password,
-            "method": "getVoicemailMessageFile",
-            "mailbox": mailbox,
-            "folder": folder,
-            "message_num": message_num,
-        }
+        url = self._build_url(
+            method="getVoicemailMessageFile",
+            mailbox=mailbox,
+            folder=folder,
+            message_num=message_num,
+        )
 
         try:
-            response = self._session.get(API_URL, params=params, timeout=60)
-            response.raise_for_status()
-
-            # Check if response is JSON (error) or binary (audio)
-            content_type = response.headers.get("Content-Type", "")
-            if "application/json" in content_type or "text/" in content_type:
-                try:
-                    data = response.json()
-                    if data.get("status") != "success":
-                        raise VoipMsError(f"API error: {data.get('status')}")
-                except ValueError:
-                    pass
-
-            return response.content
-        except requests.RequestException as err:
+            async with self._session.get(
+                url,
+                # Reads are paced by the downstream client, so bound each
+                # read rather than the whole transfer
+                timeout=aiohttp.ClientTimeout(
+                    total=None,
+                    sock_connect=30,
+                    sock_read=60
+                ),
+            ) as response:
+                response.raise_for_status()
+
+                # Check if response is JSON (error) or binary (audio)
+                content_type = response.headers.get("Content-Type", "")
+                if "application/json" in content_type or "text/" in content_type:
+                    try:
+                        data = await response.json(content_type=None)
+                        if data.get("status") != "success":
+                            raise VoipMsError(f"API error: {data.get('status')}")
+                    except ValueError:
+                        pass
+                    # Body has already been read in full
+                    body = await response.read()
+                    if body:
+                        yield body
+                    return
+
+                async for chunk in response.content.iter_chunked(CHUNK_SIZE):
+                    yield chunk
+        except TimeoutError as err:
+            raise VoipMsError("Failed to get audio file: timed out") from err
+        except aiohttp.ClientError as err:
             raise VoipMsError(f"Failed to get audio file: {err}") from err
 
-    def test_connection(self) -> bool:
+    async def test_connection(self) -> bool:
         """Test API connection.
 
         Returns:
@@ -161,5 +222,5 @@ class VoipMsClient:
         Raises:
             VoipMsError: If connection fails
         """
-        self._make_request("getBalance")
+        await self._make_request("getBalance")
         return True